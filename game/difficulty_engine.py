@@ -0,0 +1,190 @@
+import logging
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LevelConfig:
+    level: int
+    item_count: int
+    distractors: int
+    time_bonus: float
+
+
+@dataclass
+class LevelStats:
+    """Rolling statistics for a single level, kept as exponential moving averages."""
+
+    ema_time: float = 0.0
+    ema_errors: float = 0.0
+    samples: int = 0
+
+    def update(self, duration: float, errors: int, alpha: float) -> None:
+        if self.samples == 0:
+            self.ema_time = duration
+            self.ema_errors = float(errors)
+        else:
+            self.ema_time += alpha * (duration - self.ema_time)
+            self.ema_errors += alpha * (errors - self.ema_errors)
+        self.samples += 1
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LevelStats":
+        """Convert a dictionary into a LevelStats instance."""
+        return cls(
+            ema_time=float(data.get("ema_time", 0.0)),
+            ema_errors=float(data.get("ema_errors", 0.0)),
+            samples=int(data.get("samples", 0)),
+        )
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class SessionRecord:
+    level: int
+    duration: float
+    errors: int = 0
+
+
+EASIER = "easier"
+SAME = "same"
+HARDER = "harder"
+
+
+class DifficultyEngine:
+    """
+    Choose the configuration of the next level from the player's score history.
+    Statistics use O(1) memory per level and the candidate configurations are
+    precomputed on every update, so picking the next level is a dict lookup.
+    """
+
+    BASE_ITEMS = 3
+    MAX_ITEMS = 6
+    MAX_DISTRACTORS = 3
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        fast_time: float = 10.0,
+        slow_time: float = 30.0,
+        max_errors: float = 1.0,
+        max_level: Optional[int] = None,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in the range (0, 1].")
+        if fast_time >= slow_time:
+            raise ValueError("fast_time must be lower than slow_time.")
+        self.alpha = alpha
+        self.fast_time = fast_time
+        self.slow_time = slow_time
+        self.max_errors = max_errors
+        self.max_level = max_level
+        self.stats: Dict[int, LevelStats] = {}
+        self._candidates: Dict[int, Dict[str, LevelConfig]] = {}
+
+    def record(self, level: int, duration: float, errors: int = 0) -> LevelConfig:
+        """Update the statistics of a level and return the next level to play."""
+        if level < 1:
+            raise ValueError("Level must be greater than or equal to 1.")
+        if duration < 0 or errors < 0:
+            raise ValueError("Duration and errors cannot be negative.")
+        self.stats.setdefault(level, LevelStats()).update(duration, errors, self.alpha)
+        self._candidates[level] = self._build_candidates(level)
+        return self.next_level(level)
+
+    def load_stats(self, data: Dict[str, dict]) -> None:
+        """
+        Restore the statistics saved with the player's progress, skipping
+        the entries that are not valid levels or statistics.
+        """
+        for key, stats in data.items():
+            try:
+                level = int(key)
+                if level < 1:
+                    raise ValueError("Level must be greater than or equal to 1.")
+                level_stats = LevelStats.from_dict(stats)
+            except (ValueError, TypeError, AttributeError) as e:
+                logging.warning(f"Skipping difficulty statistics of level {key!r}: {e}")
+                continue
+            self.stats[level] = level_stats
+            self._candidates[level] = self._build_candidates(level)
+
+    def dump_stats(self, level: int) -> Dict[str, float]:
+        """Return the statistics of a level ready to be saved."""
+        return self.stats[level].to_dict()
+
+    def next_level(self, level: int) -> LevelConfig:
+        """Return the precomputed configuration to play after `level`."""
+        candidates = self._candidates.get(level)
+        if candidates is None:
+            candidates = self._candidates[level] = self._build_candidates(level)
+        return candidates[self.classify(level)]
+
+    def classify(self, level: int) -> str:
+        """Classify the player's performance on a level as easier, same or harder."""
+        stats = self.stats.get(level)
+        if stats is None or stats.samples == 0:
+            return SAME
+        if stats.ema_time > self.slow_time or stats.ema_errors > self.max_errors:
+            return EASIER
+        if stats.ema_time < self.fast_time and stats.ema_errors < self.max_errors / 2:
+            return HARDER
+        return SAME
+
+    def predicted_time(self, level: int) -> Optional[float]:
+        stats = self.stats.get(level)
+        return stats.ema_time if stats and stats.samples else None
+
+    def _build_candidates(self, level: int) -> Dict[str, LevelConfig]:
+        next_level = level + 1
+        if self.max_level is not None:
+            next_level = min(next_level, self.max_level)
+        return {
+            EASIER: self._config(level, -1),
+            SAME: self._config(next_level, 0),
+            HARDER: self._config(next_level, 1),
+        }
+
+    def _config(self, level: int, shift: int) -> LevelConfig:
+        step = max(0, level - 1 + shift)
+        item_count = min(self.BASE_ITEMS + step // 2, self.MAX_ITEMS)
+        distractors = min(max(0, step // 3 + shift), self.MAX_DISTRACTORS)
+        # Only the easier configuration of a struggling player grants extra
+        # time, so the scores of the same and harder configurations stay
+        # comparable between players.
+        time_bonus = 0.0
+        stats = self.stats.get(level)
+        if shift < 0 and stats and stats.samples:
+            time_bonus = max(0.0, round(stats.ema_time - self.fast_time, 1))
+        return LevelConfig(level, item_count, distractors, time_bonus)
+
+
+def evaluate_sessions(
+    sessions: Iterable[Iterable[SessionRecord]], **engine_options
+) -> Tuple[float, List[LevelConfig]]:
+    """
+    Replay recorded sessions through a fresh engine per session.
+    Return the mean absolute error of the predicted completion times, which can
+    be minimized offline to tune the engine parameters, and the final
+    configuration chosen at the end of each session.
+    """
+    total_error = 0.0
+    predictions = 0
+    final_configs: List[LevelConfig] = []
+
+    for session in sessions:
+        engine = DifficultyEngine(**engine_options)
+        config: Optional[LevelConfig] = None
+        for record in session:
+            expected = engine.predicted_time(record.level)
+            if expected is not None:
+                total_error += abs(expected - record.duration)
+                predictions += 1
+            config = engine.record(record.level, record.duration, record.errors)
+        if config is not None:
+            final_configs.append(config)
+
+    mean_error = total_error / predictions if predictions else 0.0
+    return mean_error, final_configs
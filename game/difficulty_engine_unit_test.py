@@ -0,0 +1,96 @@
+import pytest
+from game.difficulty_engine import (
+    DifficultyEngine,
+    SessionRecord,
+    evaluate_sessions,
+)
+
+
+def test_record_keeps_exponential_moving_average():
+    engine = DifficultyEngine(alpha=0.5)
+    engine.record(level=1, duration=10, errors=0)
+    engine.record(level=1, duration=20, errors=2)
+
+    stats = engine.stats[1]
+    assert stats.samples == 2
+    assert stats.ema_time == 15
+    assert stats.ema_errors == 1
+
+
+def test_fast_player_gets_harder_next_level():
+    engine = DifficultyEngine()
+    config = engine.record(level=2, duration=4, errors=0)
+
+    assert config.level == 3
+    assert config.distractors >= 1
+    assert config.time_bonus == 0
+
+
+def test_slow_player_repeats_level_with_time_bonus():
+    engine = DifficultyEngine()
+    config = engine.record(level=2, duration=60, errors=3)
+
+    assert config.level == 2
+    assert config.distractors == 0
+    assert config.time_bonus > 0
+
+
+def test_only_easier_configs_get_time_bonus():
+    engine = DifficultyEngine()
+
+    assert engine.next_level(1).time_bonus == 0
+    assert engine.record(level=1, duration=20, errors=0).time_bonus == 0
+
+
+def test_next_level_is_capped_by_max_level():
+    engine = DifficultyEngine(max_level=5)
+    config = engine.record(level=5, duration=15, errors=0)
+
+    assert config.level == 5
+
+
+def test_record_raises_error_for_invalid_values():
+    engine = DifficultyEngine()
+
+    with pytest.raises(ValueError, match="Level must be greater than or equal to 1"):
+        engine.record(level=0, duration=5)
+
+    with pytest.raises(ValueError, match="cannot be negative"):
+        engine.record(level=1, duration=-1)
+
+
+def test_evaluate_sessions_reports_prediction_error():
+    sessions = [
+        [SessionRecord(1, 10), SessionRecord(1, 20)],
+        [SessionRecord(1, 5), SessionRecord(2, 5)],
+    ]
+    mean_error, configs = evaluate_sessions(sessions, alpha=0.5)
+
+    assert mean_error == 10
+    assert len(configs) == 2
+
+
+def test_stats_round_trip_restores_next_level():
+    engine = DifficultyEngine()
+    expected = engine.record(level=2, duration=4, errors=0)
+
+    restored = DifficultyEngine()
+    restored.load_stats({"2": engine.dump_stats(2)})
+
+    assert restored.stats[2] == engine.stats[2]
+    assert restored.next_level(2) == expected
+
+
+def test_load_stats_skips_invalid_entries():
+    engine = DifficultyEngine()
+    engine.load_stats(
+        {
+            "two": {"ema_time": 5, "samples": 1},
+            "0": {"ema_time": 5, "samples": 1},
+            "3": {"ema_time": "fast"},
+            "4": [],
+            "5": {"ema_time": 5, "ema_errors": 0, "samples": 1},
+        }
+    )
+
+    assert list(engine.stats) == [5]
@@ -12,5 +12,14 @@ def calculate_performance_score(
     The score decreases as the duration increases, using an exponential decay formula.
     """
     duration = (end_time - start_time).total_seconds()
+    return score_for_duration(duration, base_score, factor)
+
+
+def score_for_duration(
+    duration: float,
+    base_score: float = 10.0,
+    factor: float = 0.1,
+) -> int:
+    """Calculate the performance score from a duration in seconds."""
     score = base_score * (1 / (1 + factor * duration))
     return max(0, round(score))
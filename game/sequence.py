@@ -0,0 +1,43 @@
+import random
+from typing import List, Optional
+
+
+class SequenceRound:
+    """
+    Rules of a single sequencing round, independent of the UI:
+    the player selects every image once and the order is then validated.
+    """
+
+    def __init__(self, correct_order: List[int], seed: Optional[int] = None):
+        self.correct_order = correct_order
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.shuffled_indices = list(range(len(correct_order)))
+        random.Random(self.seed).shuffle(self.shuffled_indices)
+        self.selected_order: List[int] = []
+        self.errors = 0
+        self.completed = False
+
+    @property
+    def item_count(self) -> int:
+        return len(self.correct_order)
+
+    def select(self, image_idx: int) -> bool:
+        """Add an image to the selected order. Return False if it was ignored."""
+        if self.completed or self.is_full():
+            return False
+        if not 0 <= image_idx < self.item_count:
+            raise ValueError(f"Invalid image index: {image_idx}")
+        self.selected_order.append(image_idx)
+        return True
+
+    def is_full(self) -> bool:
+        return len(self.selected_order) >= self.item_count
+
+    def validate(self) -> bool:
+        """Check the selected order, resetting it and counting an error if wrong."""
+        if self.selected_order == self.correct_order:
+            self.completed = True
+            return True
+        self.errors += 1
+        self.selected_order = []
+        return False
@@ -0,0 +1,148 @@
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from .difficulty_engine import SessionRecord
+from .game_engine import score_for_duration
+from .sequence import SequenceRound
+
+SESSIONS_DIR = "memory/sessions"
+
+
+@dataclass
+class SessionRecording:
+    """
+    Compact recording of a played level: the shuffle seed, the clicked images
+    with their time in milliseconds since the level was first shown, and the
+    outcome to reproduce.
+    """
+
+    level: int
+    seed: int
+    correct_order: List[int]
+    clicks: List[List[int]] = field(default_factory=list)
+    duration_ms: int = 0
+    time_bonus: float = 0.0
+    errors: int = 0
+    score: Optional[int] = None
+    version: int = 1
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionRecording":
+        """Convert a dictionary into a SessionRecording instance."""
+        return cls(**data)
+
+    @classmethod
+    def load(cls, path: str) -> "SessionRecording":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, separators=(",", ":"))
+
+    def to_session_record(self) -> SessionRecord:
+        """Return the record used to evaluate the difficulty engine offline."""
+        return SessionRecord(self.level, self.duration_ms / 1000, self.errors)
+
+
+class SessionRecorder:
+    def __init__(self, level: int, seed: int, correct_order: List[int]):
+        self.recording = SessionRecording(level, seed, list(correct_order))
+
+    def click(self, image_idx: int, elapsed: float) -> None:
+        self.recording.clicks.append([round(elapsed * 1000), image_idx])
+
+    def finish(
+        self, duration: float, errors: int, score: int, time_bonus: float = 0.0
+    ) -> SessionRecording:
+        self.recording.duration_ms = round(duration * 1000)
+        self.recording.errors = errors
+        self.recording.score = score
+        self.recording.time_bonus = time_bonus
+        return self.recording
+
+
+@dataclass
+class ReplayReport:
+    recording: SessionRecording
+    completed: bool
+    errors: int
+    score: Optional[int]
+    step_times: List[float] = field(default_factory=list)
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def replay_session(recording: SessionRecording) -> ReplayReport:
+    """
+    Replay a recording headlessly through the same rules as the level window
+    and compare the outcome with the recorded one.
+    `step_times` holds the processing time of every click in seconds.
+    """
+    round_ = SequenceRound(recording.correct_order, recording.seed)
+    step_times = []
+    completing_click = None
+    for i, (_, image_idx) in enumerate(recording.clicks):
+        step_start = time.perf_counter()
+        if round_.select(image_idx) and round_.is_full() and round_.validate():
+            completing_click = i
+        step_times.append(time.perf_counter() - step_start)
+    return compare_outcome(recording, round_, completing_click, step_times)
+
+
+def compare_outcome(
+    recording: SessionRecording,
+    round_: SequenceRound,
+    completing_click: Optional[int],
+    step_times: List[float],
+) -> ReplayReport:
+    """
+    Build the report of a replayed round. The score is derived from the
+    recorded time of the click that completed the replayed round.
+    """
+    score = None
+    mismatches = []
+    if round_.completed and completing_click is not None:
+        duration_ms = recording.clicks[completing_click][0]
+        if duration_ms != recording.duration_ms:
+            mismatches.append(f"duration {duration_ms} != {recording.duration_ms} ms")
+        score = score_for_duration(max(0.0, duration_ms / 1000 - recording.time_bonus))
+    else:
+        mismatches.append("level was not completed")
+    if round_.errors != recording.errors:
+        mismatches.append(f"errors {round_.errors} != {recording.errors}")
+    if score != recording.score:
+        mismatches.append(f"score {score} != {recording.score}")
+    return ReplayReport(
+        recording, round_.completed, round_.errors, score, step_times, mismatches
+    )
+
+
+def replay_corpus(directory: str = SESSIONS_DIR) -> List[ReplayReport]:
+    """Replay every recording saved in `directory`."""
+    return [
+        replay_session(SessionRecording.load(str(path)))
+        for path in sorted(Path(directory).glob("*.json"))
+    ]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    reports = replay_corpus(sys.argv[1] if len(sys.argv) > 1 else SESSIONS_DIR)
+    for report in reports:
+        total = sum(report.step_times) * 1000
+        status = "ok" if report.ok else "; ".join(report.mismatches)
+        logging.info(
+            f"level {report.recording.level} seed {report.recording.seed}: "
+            f"{len(report.step_times)} steps in {total:.3f} ms, {status}"
+        )
+    sys.exit(0 if all(report.ok for report in reports) else 1)
@@ -0,0 +1,76 @@
+from pathlib import Path
+from game.game_engine import score_for_duration
+from game.sequence import SequenceRound
+from game.session import (
+    SessionRecorder,
+    SessionRecording,
+    replay_corpus,
+    replay_session,
+)
+
+
+def record_session(clicks, time_bonus=0.0) -> SessionRecording:
+    """Record clicks the way PlayingLevelUI does."""
+    round_ = SequenceRound([0, 1, 2], seed=42)
+    recorder = SessionRecorder(1, round_.seed, round_.correct_order)
+    duration = 0.0
+    for elapsed, image_idx in clicks:
+        if round_.select(image_idx):
+            recorder.click(image_idx, elapsed)
+            if round_.is_full():
+                duration = elapsed
+                round_.validate()
+    score = score_for_duration(max(0.0, duration - time_bonus))
+    return recorder.finish(duration, round_.errors, score, time_bonus)
+
+
+def test_same_seed_shuffles_images_identically():
+    assert (
+        SequenceRound([0, 1, 2, 3, 4], seed=7).shuffled_indices
+        == SequenceRound([0, 1, 2, 3, 4], seed=7).shuffled_indices
+    )
+
+
+def test_replay_reproduces_recorded_outcome_and_score():
+    recording = record_session(
+        [(1.0, 2), (2.0, 1), (3.0, 0), (5.0, 0), (6.0, 1), (17.0, 2)],
+        time_bonus=2.0,
+    )
+    report = replay_session(recording)
+
+    assert report.ok, report.mismatches
+    assert report.completed
+    assert report.errors == 1
+    assert report.score == recording.score == score_for_duration(15.0)
+    assert len(report.step_times) == 6
+
+
+def test_replay_derives_score_from_completing_click():
+    recording = record_session([(1.0, 0), (2.0, 1), (30.0, 2)])
+    recording.clicks[-1][0] = 3000
+
+    report = replay_session(recording)
+
+    assert not report.ok
+    assert report.score == score_for_duration(3.0)
+    assert "duration 3000 != 30000 ms" in report.mismatches
+
+
+def test_replay_reports_mismatching_score():
+    recording = record_session([(1.0, 0), (2.0, 1), (3.0, 2)])
+    recording.score += 1
+
+    report = replay_session(recording)
+
+    assert not report.ok
+    assert report.mismatches == [f"score {recording.score - 1} != {recording.score}"]
+
+
+def test_recordings_round_trip_through_corpus(tmp_path: Path):
+    recording = record_session([(1.0, 0), (2.0, 1), (3.0, 2)])
+    recording.save(str(tmp_path / "session.json"))
+
+    assert SessionRecording.load(str(tmp_path / "session.json")) == recording
+    reports = replay_corpus(str(tmp_path))
+    assert [report.ok for report in reports] == [True]
+    assert recording.to_session_record().duration == 3.0
@@ -1,33 +1,67 @@
 import logging
 from memory.controller import ProgressController
+from memory.watcher import ProgressWatcher
 from ui.menu import MenuUI
 from ui.playing_level import PlayingLevelUI
-from resources.image_handler import load_images_for_level
+from ui.loading import LoadingUI
+from resources.image_handler import release_images_for_level
+from resources.level_loader import LevelLoader
 from datetime import datetime
-from game.game_engine import calculate_performance_score
+from typing import Dict
+from game.game_engine import score_for_duration
+from game.difficulty_engine import DifficultyEngine, LevelConfig
+from game.session import SESSIONS_DIR
 from resources.sound_handler import SoundHandler
 
 
 def start_level(level: int) -> None:
-    logging.info(f"Level {level} selected! Starting the level...")
+    logging.info(f"Level {level} selected! Loading the level...")
+
+    loading_window = LoadingUI(app, level)
+    level_loader.load(
+        level,
+        on_ready=lambda images: open_level(level, images),
+        on_finished=loading_window.destroy,
+    )
 
-    images = load_images_for_level(level)
-    if len(images) < 3:
-        logging.error(f"Not enough images to start level {level}")
-        return
 
+def open_level(level: int, images: list) -> None:
     correct_order = [0, 1, 2]
-    start_time = datetime.utcnow()
+    config = level_configs.get(level)
+    time_bonus = config.time_bonus if config else 0
 
-    def on_level_complete(level_completed: int):
-        end_time = datetime.utcnow()
-        score = calculate_performance_score(start_time, end_time)
-        controller.complete_level(level_completed, score)
+    def on_level_complete(level_completed: int, duration: float):
+        score = score_for_duration(max(0.0, duration - time_bonus))
+        next_config = difficulty.record(
+            level_completed, duration, playing_window.errors
+        )
+        controller.complete_level(
+            level_completed, score, difficulty.dump_stats(level_completed)
+        )
         logging.info(f"Level {level_completed} completed with score {score}")
+
+        recording = playing_window.recorder.finish(
+            duration, playing_window.errors, score, time_bonus
+        )
+        try:
+            recording.save(
+                f"{SESSIONS_DIR}/{datetime.utcnow():%Y%m%dT%H%M%S}"
+                f"_level{level_completed}.json"
+            )
+        except IOError as e:
+            logging.error(f"Error saving session recording: {e}")
+
+        level_configs[next_config.level] = next_config
+        logging.info(f"Next level suggested by difficulty engine: {next_config}")
         app.refresh_menu()
 
     playing_window = PlayingLevelUI(
-        app, level, images, correct_order, on_level_complete
+        app,
+        level,
+        images,
+        correct_order,
+        on_level_complete,
+        on_close=lambda: release_images_for_level(level),
     )
     playing_window.grab_set()
 
@@ -39,19 +73,20 @@ if __name__ == "__main__":
 
     try:
         controller = ProgressController()
+        difficulty = DifficultyEngine(max_level=MenuUI.MAX_LEVELS)
+        difficulty.load_stats(controller.get_difficulty_stats())
+        level_configs: Dict[int, LevelConfig] = {}
+        for played_level in sorted(difficulty.stats):
+            config = difficulty.next_level(played_level)
+            level_configs[config.level] = config
         app = MenuUI(controller, start_level)
-
-        def refresh_menu():
-            for btn in app.level_buttons:
-                btn.destroy()
-            app.level_buttons.clear()
-            app.create_widgets()
+        level_loader = LevelLoader(app)
+        watcher = ProgressWatcher(controller, app.on_progress_changed)
+        watcher.start(app)
 
         sound_handler = SoundHandler()
         sound_handler.play_background_music()
 
-        app.refresh_menu = refresh_menu
-
         app.mainloop()
     except Exception as e:
         logging.error(f"An error occurred: {e}")
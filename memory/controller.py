@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-from .db import ProgressJsonAdapter, Settings, Progress
+from .db import ProgressJsonAdapter, Settings, Progress, diff_progress
 
 
 class ProgressController:
@@ -12,14 +13,28 @@ class ProgressController:
         self, filepath: str = DEFAULT_FILEPATH, progress: Optional[Progress] = None
     ):
         self.adapter = ProgressJsonAdapter(filepath)
-        self.progress: Optional[Progress] = (
-            progress if progress else self.adapter.load()
-        )
+        if progress is not None:
+            # Save the given progress, so transactions build on it instead of
+            # reloading whatever the file held before.
+            self.adapter.create(progress)
+            self.progress: Optional[Progress] = progress
+        else:
+            self.progress = self.adapter.load()
 
     def _require_progress(self) -> None:
         if self.progress is None:
             raise ValueError("Progress data is not loaded.")
 
+    @contextmanager
+    def _transaction(self) -> Iterator[Progress]:
+        """Apply changes on top of the latest saved progress and save them."""
+        self._require_progress()
+        if self.adapter.progress is None:
+            self.adapter.progress = self.progress
+        with self.adapter.transaction() as progress:
+            self.progress = progress
+            yield progress
+
     def get_unlocked_levels(self) -> List[int]:
         """Return a list of all levels the player can access."""
         self._require_progress()
@@ -35,10 +50,13 @@ class ProgressController:
         self._require_progress()
         return level <= self.progress.unlocked_level
 
-    def complete_level(self, level: int, score: int) -> None:
+    def complete_level(
+        self, level: int, score: int, level_stats: Optional[Dict[str, float]] = None
+    ) -> None:
         """
         Mark a level as completed, update score if higher,
         unlock the next level, and update last played timestamp.
+        `level_stats` replaces the difficulty statistics stored for the level.
         """
         self._require_progress()
         if level < 1:
@@ -46,23 +64,25 @@ class ProgressController:
         if score < 0:
             raise ValueError("Score cannot be negative.")
 
-        if level not in self.progress.completed_levels:
-            self.progress.completed_levels.append(level)
-            logging.debug(f"Level {level} added to completed levels.")
+        with self._transaction() as progress:
+            if level not in progress.completed_levels:
+                progress.completed_levels.append(level)
+                logging.debug(f"Level {level} added to completed levels.")
 
-        prev_score = self.progress.performance_score.get(str(level), 0)
-        if score > prev_score:
-            self.progress.performance_score[str(level)] = score
-            logging.debug(
-                f"Score for level {level} updated from {prev_score} to {score}."
-            )
+            prev_score = progress.performance_score.get(str(level), 0)
+            if score > prev_score:
+                progress.performance_score[str(level)] = score
+                logging.debug(
+                    f"Score for level {level} updated from {prev_score} to {score}."
+                )
 
-        if level >= self.progress.unlocked_level:
-            self.progress.unlocked_level = level + 1
-            logging.debug(f"Unlocked level updated to {self.progress.unlocked_level}.")
+            if level >= progress.unlocked_level:
+                progress.unlocked_level = level + 1
+                logging.debug(f"Unlocked level updated to {progress.unlocked_level}.")
 
-        self.progress.timestamps.last_played = datetime.utcnow().isoformat()
-        self.adapter.save()
+            progress.timestamps.last_played = datetime.utcnow().isoformat()
+            if level_stats is not None:
+                progress.difficulty[str(level)] = dict(level_stats)
 
         logging.info(f"Level {level} completed with score {score}. Progress saved.")
 
@@ -71,8 +91,8 @@ class ProgressController:
         self._require_progress()
         if level < 1 or score < 0:
             raise ValueError("Invalid level or score.")
-        self.progress.performance_score[str(level)] = score
-        self.adapter.save()
+        with self._transaction() as progress:
+            progress.performance_score[str(level)] = score
         logging.info(f"Max score for level {level} set to {score}.")
 
     def get_performance_score(self, level: int) -> int:
@@ -85,23 +105,47 @@ class ProgressController:
         self._require_progress()
         return self.progress.completed_levels
 
-    def update_settings(self, sounds: bool) -> None:
-        """Update the user's sound settings."""
-        self._require_progress()
-        self.progress.settings.sounds = sounds
-        self.adapter.save()
-        logging.info(f"Settings updated: sounds = {sounds}")
+    def update_settings(
+        self, sounds: Optional[bool] = None, language: Optional[str] = None
+    ) -> None:
+        """Update the user's sound and language settings."""
+        with self._transaction() as progress:
+            if sounds is not None:
+                progress.settings.sounds = sounds
+            if language is not None:
+                progress.settings.language = language
+        logging.info(
+            f"Settings updated: sounds = {progress.settings.sounds}, "
+            f"language = {progress.settings.language}"
+        )
 
     def get_settings(self) -> Settings:
         """Return the current settings object."""
         self._require_progress()
         return self.progress.settings
 
+    def get_difficulty_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the difficulty engine statistics saved for each level."""
+        self._require_progress()
+        return self.progress.difficulty
+
     def get_last_played(self) -> Optional[str]:
         """Return the ISO timestamp of the last time the game was played."""
         self._require_progress()
         return self.progress.timestamps.last_played
 
+    def reload_progress(self) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Reload progress from the file after an external modification and
+        return the fields that changed as {field: (old, new)}.
+        """
+        previous = self.progress
+        self.progress = self.adapter.reload()
+        changes = diff_progress(previous, self.progress)
+        if changes:
+            logging.info(f"Progress reloaded, changed fields: {sorted(changes)}")
+        return changes
+
     def reset_progress(self) -> None:
         """Reset all progress to initial state."""
         self.adapter.reset()
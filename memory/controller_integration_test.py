@@ -3,7 +3,8 @@ import tempfile
 from pathlib import Path
 from typing import Generator, Any
 import pytest
-from controller import ProgressController
+from memory.controller import ProgressController
+from memory.db import Progress
 import os
 
 
@@ -220,3 +221,63 @@ def test_delete_progress_removes_file_and_clears_memory(
 
     assert not os.path.exists(temp_progress_file)
     assert controller.progress is None
+
+
+def test_complete_level_persists_difficulty_stats(temp_progress_file: Path) -> None:
+    controller = ProgressController(filepath=str(temp_progress_file))
+    stats = {"ema_time": 12.5, "ema_errors": 0.3, "samples": 2}
+
+    controller.complete_level(level=3, score=5, level_stats=stats)
+
+    reloaded_controller = ProgressController(filepath=str(temp_progress_file))
+    assert reloaded_controller.get_difficulty_stats() == {"3": stats}
+
+
+def test_slightly_malformed_progress_survives_startup_and_save(
+    temp_progress_file: Path,
+) -> None:
+    with open(temp_progress_file, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "unlocked_level": 3,
+                "completed_levels": [1, 2],
+                "performance_score": {"1": 3.0},
+            },
+            f,
+        )
+
+    controller = ProgressController(filepath=str(temp_progress_file))
+    controller.update_settings(sounds=False)
+
+    with open(temp_progress_file, "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["unlocked_level"] == 3
+    assert saved["completed_levels"] == [1, 2]
+    assert saved["performance_score"] == {"1": 3.0}
+    assert saved["settings"]["sounds"] is False
+
+
+def test_unreadable_progress_is_backed_up_before_being_overwritten(
+    temp_progress_file: Path,
+) -> None:
+    temp_progress_file.write_text("{ not json", encoding="utf-8")
+
+    controller = ProgressController(filepath=str(temp_progress_file))
+    controller.update_settings(sounds=False)
+
+    backups = list(temp_progress_file.parent.glob("progress.json.*.bak"))
+    assert len(backups) == 1
+    assert backups[0].read_text(encoding="utf-8") == "{ not json"
+
+
+def test_injected_progress_is_kept_by_later_updates(temp_progress_file: Path) -> None:
+    temp_progress_file.write_text(json.dumps({"unlocked_level": 2}), encoding="utf-8")
+    progress = Progress(unlocked_level=7, completed_levels=[1, 2, 3, 4, 5, 6])
+
+    controller = ProgressController(filepath=str(temp_progress_file), progress=progress)
+    controller.complete_level(2, 5)
+
+    reloaded = ProgressController(filepath=str(temp_progress_file))
+    assert reloaded.get_unlocked_level() == 7
+    assert reloaded.progress.completed_levels == [1, 2, 3, 4, 5, 6]
+    assert reloaded.progress.performance_score == {"2": 5}
@@ -1,9 +1,20 @@
 import logging
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 import json
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Advisory file locks are only available on POSIX.
+    fcntl = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -13,6 +24,7 @@ logging.basicConfig(
 @dataclass
 class Settings:
     sounds: bool = True
+    language: str = "es"
 
 
 @dataclass
@@ -27,23 +39,135 @@ class Progress:
     performance_score: Dict[str, int] = field(default_factory=dict)
     settings: Settings = field(default_factory=Settings)
     timestamps: Timestamps = field(default_factory=Timestamps)
+    # Rolling statistics of the difficulty engine, per level
+    difficulty: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Progress":
-        """Convert a dictionary into a Progress instance."""
-        return cls(
-            unlocked_level=data.get("unlocked_level", 1),
-            completed_levels=data.get("completed_levels", []),
-            performance_score=data.get("performance_score", {}),
-            settings=Settings(**data.get("settings", {})),
-            timestamps=Timestamps(**data.get("timestamps", {})),
-        )
+    def from_dict(cls, data: dict, strict: bool = False) -> "Progress":
+        """
+        Convert a dictionary into a Progress instance.
+        With `strict`, raise ValueError if any field has an unexpected type.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Progress data must be a JSON object")
+        for key in ("settings", "timestamps"):
+            if not isinstance(data.get(key, {}), dict):
+                raise ValueError(f"{key} must be an object")
+        try:
+            progress = cls(
+                unlocked_level=data.get("unlocked_level", 1),
+                completed_levels=data.get("completed_levels", []),
+                performance_score=data.get("performance_score", {}),
+                settings=Settings(**data.get("settings", {})),
+                timestamps=Timestamps(**data.get("timestamps", {})),
+                difficulty=data.get("difficulty", {}),
+            )
+        except TypeError as e:
+            raise ValueError(f"Invalid progress data: {e}")
+        if strict:
+            progress.validate()
+        return progress
+
+    def validate(self) -> None:
+        """Raise ValueError if any field has an unexpected type or value."""
+        if not _is_int(self.unlocked_level) or self.unlocked_level < 1:
+            raise ValueError("unlocked_level must be an integer >= 1")
+        if not isinstance(self.completed_levels, list) or not all(
+            _is_int(level) for level in self.completed_levels
+        ):
+            raise ValueError("completed_levels must be a list of integers")
+        if not isinstance(self.performance_score, dict) or not all(
+            isinstance(level, str) and _is_int(score)
+            for level, score in self.performance_score.items()
+        ):
+            raise ValueError("performance_score must map levels to integers")
+        if not isinstance(self.settings.sounds, bool):
+            raise ValueError("settings.sounds must be a boolean")
+        if not isinstance(self.settings.language, str):
+            raise ValueError("settings.language must be a string")
+        if not isinstance(self.timestamps.last_played, (str, type(None))):
+            raise ValueError("timestamps.last_played must be a string")
+        if not isinstance(self.difficulty, dict) or not all(
+            isinstance(level, str)
+            and level.isdigit()
+            and int(level) >= 1
+            and isinstance(stats, dict)
+            and all(isinstance(value, (int, float)) for value in stats.values())
+            for level, stats in self.difficulty.items()
+        ):
+            raise ValueError("difficulty must map levels >= 1 to numeric statistics")
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
 
 
 class ProgressJsonAdapter:
     def __init__(self, filepath: str):
         self.filepath = Path(filepath)
         self.progress: Optional[Progress] = None
+        # (mtime_ns, size) of the file as last read or written by this adapter
+        self.stat_signature: Optional[Tuple[int, int]] = None
+        self.lock_path = self.filepath.with_name(self.filepath.name + ".lock")
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+        # Changes made by others and merged in by a transaction, kept until
+        # the watcher reports them.
+        self.pending_changes: Dict[str, Tuple[Any, Any]] = {}
+        # Signature of the last unreadable file copied aside
+        self._backup_signature: Optional[Tuple[int, int]] = None
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold the in-process lock and an advisory lock on the progress file,
+        so threads and other processes cannot interleave their changes.
+        The lock is reentrant within a thread.
+        """
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                self._lock_file = open(self.lock_path, "a")
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[Progress]:
+        """
+        Reload the latest progress from the file under lock, yield it to be
+        modified and save it, so concurrent updates are never lost.
+        """
+        with self.locked():
+            if self.filepath.exists():
+                previous = self.progress
+                try:
+                    self.progress = self._read_file()
+                except (ValueError, AttributeError, IOError) as e:
+                    logging.error(f"Error reloading progress: {e}")
+                    self._backup_unreadable_file()
+                else:
+                    if previous is not None:
+                        merge_changes(
+                            self.pending_changes, diff_progress(previous, self.progress)
+                        )
+            if self.progress is None:
+                self.progress = Progress()
+            yield self.progress
+            self.save()
+
+    def take_pending_changes(self) -> Dict[str, Tuple[Any, Any]]:
+        """Return and clear the changes merged in by transactions."""
+        with self._lock:
+            changes, self.pending_changes = self.pending_changes, {}
+        return changes
 
     def load(self) -> Progress:
         """Load progress from the JSON file."""
@@ -53,12 +177,11 @@ class ProgressJsonAdapter:
             return self.progress
 
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.progress = Progress.from_dict(data)
+            self.progress = self._read_file()
             logging.info("Progress loaded successfully.")
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             logging.error(f"Error loading progress: {e}. Resetting progress.")
+            self._backup_unreadable_file()
             self.progress = Progress()
         return self.progress
 
@@ -67,12 +190,67 @@ class ProgressJsonAdapter:
         if self.progress is None:
             raise ValueError("No progress data to save")
         try:
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(asdict(self.progress), f, indent=4)
+            with self.locked():
+                # Write a temporary file and swap it in, so readers never
+                # see a partially written progress file.
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.filepath.parent, prefix=self.filepath.name, suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(asdict(self.progress), f, indent=4)
+                    if self.filepath.exists():
+                        os.chmod(tmp_path, self.filepath.stat().st_mode & 0o777)
+                    os.replace(tmp_path, self.filepath)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                self.stat_signature = self.file_signature()
             logging.info("Progress saved successfully.")
         except IOError as e:
             logging.error(f"Error saving progress: {e}")
 
+    def reload(self) -> Progress:
+        """
+        Reload progress from the JSON file after an external modification,
+        keeping the in-memory progress and raising the error if the file
+        cannot be read, parsed or has fields with unexpected types.
+        """
+        self.progress = self._read_file(strict=True)
+        logging.info("Progress reloaded from file.")
+        return self.progress
+
+    def file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return the (mtime_ns, size) of the progress file, if it exists."""
+        try:
+            stat = self.filepath.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_file(self, strict: bool = False) -> Progress:
+        signature = self.file_signature()
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        progress = Progress.from_dict(data, strict)
+        self.stat_signature = signature
+        return progress
+
+    def _backup_unreadable_file(self) -> None:
+        """Copy a progress file that cannot be read aside before it is overwritten."""
+        signature = self.file_signature()
+        if signature is None or signature == self._backup_signature:
+            return
+        backup = self.filepath.with_name(
+            f"{self.filepath.name}.{datetime.utcnow():%Y%m%dT%H%M%S%f}.bak"
+        )
+        try:
+            shutil.copy2(self.filepath, backup)
+            self._backup_signature = signature
+            logging.warning(f"Unreadable progress file backed up to {backup}.")
+        except IOError as e:
+            logging.error(f"Error backing up progress file: {e}")
+
     def create(self, progress: Progress) -> None:
         """Create new progress and save it to the file."""
         self.progress = progress
@@ -101,13 +279,52 @@ class ProgressJsonAdapter:
 
     def delete(self) -> None:
         """Delete the progress file and reset in-memory progress."""
-        if self.filepath.exists():
-            self.filepath.unlink()
-            logging.info("Progress file deleted.")
-        self.progress = None
+        with self.locked():
+            if self.filepath.exists():
+                self.filepath.unlink()
+                logging.info("Progress file deleted.")
+            self.progress = None
+            self.stat_signature = None
 
     def reset(self) -> None:
         """Reset progress to default and save it to the file."""
         self.progress = Progress()
         self.save()
         logging.info("Progress reset to default.")
+
+
+def diff_progress(old: Optional[Progress], new: Progress) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Return the fields that differ between two progress snapshots as
+    {field: (old, new)}, using dotted names for nested fields.
+    """
+    old_data = _flatten(asdict(old)) if old is not None else {}
+    new_data = _flatten(asdict(new))
+    return {
+        key: (old_data.get(key), value)
+        for key, value in new_data.items()
+        if old_data.get(key) != value
+    }
+
+
+def merge_changes(
+    changes: Dict[str, Tuple[Any, Any]], newer: Dict[str, Tuple[Any, Any]]
+) -> None:
+    """Merge `newer` changes into `changes`, keeping the oldest previous values."""
+    for key, (old, new) in newer.items():
+        if key in changes:
+            old = changes[key][0]
+        if old == new:
+            changes.pop(key, None)
+        else:
+            changes[key] = (old, new)
+
+
+def _flatten(data: dict, prefix: str = "") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and key in ("settings", "timestamps"):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
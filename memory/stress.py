@@ -0,0 +1,143 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from .controller import ProgressController
+from .db import Progress, ProgressJsonAdapter
+
+SETTINGS_EVERY = 5
+
+
+@dataclass
+class StressReport:
+    operations: int
+    seconds: float
+    lost_levels: List[int] = field(default_factory=list)
+    corrupted_reads: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.lost_levels or self.corrupted_reads or self.errors)
+
+
+def _hammer(controller: ProgressController, worker: int, operations: int) -> None:
+    # Every worker completes its own range of levels, so a lost update shows
+    # up as a missing level in the final file.
+    for i in range(operations):
+        controller.complete_level(worker * operations + i + 1, score=i % 10)
+        if i % SETTINGS_EVERY == 0:
+            controller.update_settings(sounds=bool(i % 2))
+
+
+def _run_threads(filepath: str, first_worker: int, threads: int, operations: int) -> None:
+    """Run `threads` workers sharing a single controller."""
+    controller = ProgressController(filepath)
+    errors: List[BaseException] = []
+
+    def work(worker: int) -> None:
+        try:
+            _hammer(controller, worker, operations)
+        except BaseException as e:
+            errors.append(e)
+
+    workers = [
+        threading.Thread(target=work, args=(first_worker + i,)) for i in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def run_stress(
+    filepath: str, threads: int = 4, processes: int = 2, operations: int = 25
+) -> StressReport:
+    """
+    Hammer the progress file from `threads` threads in this process and in
+    each of `processes` child processes, while reading it continuously.
+    Report the throughput and any lost update or corrupted read.
+    """
+    ProgressJsonAdapter(filepath).create(Progress())
+
+    start = time.perf_counter()
+    children = [
+        multiprocessing.Process(
+            target=_run_threads, args=(filepath, (p + 1) * threads, threads, operations)
+        )
+        for p in range(processes)
+    ]
+    for child in children:
+        child.start()
+
+    stop_reading = threading.Event()
+    corrupted_reads = 0
+
+    def read_continuously() -> None:
+        nonlocal corrupted_reads
+        while not stop_reading.is_set():
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    json.load(f)
+            except json.JSONDecodeError:
+                corrupted_reads += 1
+
+    reader = threading.Thread(target=read_continuously)
+    reader.start()
+
+    errors = []
+    try:
+        _run_threads(filepath, 0, threads, operations)
+    except Exception as e:
+        errors.append(f"main process: {e!r}")
+    for child in children:
+        child.join()
+        if child.exitcode != 0:
+            errors.append(f"process {child.pid} exited with {child.exitcode}")
+    seconds = time.perf_counter() - start
+    stop_reading.set()
+    reader.join()
+
+    workers = threads * (processes + 1)
+    settings_updates = (operations + SETTINGS_EVERY - 1) // SETTINGS_EVERY
+    with open(filepath, "r", encoding="utf-8") as f:
+        progress = Progress.from_dict(json.load(f))
+    expected = set(range(1, workers * operations + 1))
+    return StressReport(
+        operations=workers * (operations + settings_updates),
+        seconds=seconds,
+        lost_levels=sorted(expected - set(progress.completed_levels)),
+        corrupted_reads=corrupted_reads,
+        errors=errors,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress test the progress store.")
+    parser.add_argument("--file", default="stress_progress.json")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--operations", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    report = run_stress(args.file, args.threads, args.processes, args.operations)
+    print(
+        f"{report.operations} operations in {report.seconds:.2f}s "
+        f"({report.ops_per_second:.0f} ops/s), lost levels: {len(report.lost_levels)}, "
+        f"corrupted reads: {report.corrupted_reads}, errors: {report.errors}"
+    )
+    for path in (Path(args.file), Path(args.file + ".lock")):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,14 @@
+from pathlib import Path
+from memory.stress import run_stress
+
+
+def test_concurrent_threads_and_processes_never_lose_updates(tmp_path: Path) -> None:
+    report = run_stress(
+        str(tmp_path / "progress.json"), threads=4, processes=2, operations=10
+    )
+
+    assert report.errors == []
+    assert report.corrupted_reads == 0
+    assert report.lost_levels == []
+    assert report.operations == 12 * 12
+    assert report.ops_per_second > 0
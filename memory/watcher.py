@@ -0,0 +1,72 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .controller import ProgressController
+from .db import merge_changes
+
+Changes = Dict[str, Tuple[Any, Any]]
+
+
+class ProgressWatcher:
+    """
+    Detect external modifications of the progress file by polling its
+    (mtime, size) signature. The adapter records the signature of its own
+    reads and writes, so saves made by the game never trigger a reload;
+    external changes merged in by those saves are reported instead.
+    """
+
+    DEFAULT_INTERVAL_MS = 1000
+
+    def __init__(
+        self,
+        controller: ProgressController,
+        on_change: Callable[[Changes], None],
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+    ):
+        self.controller = controller
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self._root = None
+        self._after_id: Optional[str] = None
+        self._failed_signature: Optional[Tuple[int, int]] = None
+
+    def check(self) -> Changes:
+        """Reload the progress if the file changed and notify the changed fields."""
+        adapter = self.controller.adapter
+        # External changes already merged in by the game's own saves.
+        changes = adapter.take_pending_changes()
+        signature = adapter.file_signature()
+        if signature not in (None, adapter.stat_signature, self._failed_signature):
+            try:
+                with adapter.locked():
+                    merge_changes(changes, self.controller.reload_progress())
+            except (json.JSONDecodeError, ValueError, AttributeError, IOError) as e:
+                # The file may be half written, retry once it changes again.
+                logging.warning(f"Could not reload progress: {e}")
+                self._failed_signature = signature
+
+        if changes:
+            self.on_change(changes)
+        return changes
+
+    def start(self, root) -> None:
+        """Poll the progress file from the Tk event loop of `root`."""
+        self._root = root
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._root is not None and self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+        self._after_id = None
+        self._root = None
+
+    def _schedule(self) -> None:
+        self._after_id = self._root.after(self.interval_ms, self._poll)
+
+    def _poll(self) -> None:
+        try:
+            self.check()
+        finally:
+            if self._root is not None:
+                self._schedule()
@@ -0,0 +1,122 @@
+import json
+import os
+from pathlib import Path
+import pytest
+from memory.controller import ProgressController
+from memory.watcher import ProgressWatcher
+
+
+@pytest.fixture
+def progress_file(tmp_path: Path) -> Path:
+    path = tmp_path / "progress.json"
+    path.write_text(
+        json.dumps(
+            {
+                "unlocked_level": 3,
+                "completed_levels": [1, 2],
+                "performance_score": {"1": 3, "2": 5},
+                "settings": {"sounds": True},
+                "timestamps": {"last_played": "2025-06-11T18:00:00Z"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def edit_externally(path: Path, **changes) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(changes)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    touch(path)
+
+
+def touch(path: Path) -> None:
+    # Make sure the modification time moves even on coarse filesystems.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_check_reloads_and_reports_only_changed_fields(progress_file: Path) -> None:
+    controller = ProgressController(filepath=str(progress_file))
+    notified = []
+    watcher = ProgressWatcher(controller, notified.append)
+
+    edit_externally(progress_file, unlocked_level=5, settings={"sounds": False})
+    changes = watcher.check()
+
+    assert changes == {"unlocked_level": (3, 5), "settings.sounds": (True, False)}
+    assert notified == [changes]
+    assert controller.get_unlocked_level() == 5
+
+
+def test_check_ignores_own_writes(progress_file: Path) -> None:
+    controller = ProgressController(filepath=str(progress_file))
+    notified = []
+    watcher = ProgressWatcher(controller, notified.append)
+
+    controller.complete_level(level=3, score=7)
+
+    assert watcher.check() == {}
+    assert notified == []
+
+
+def test_check_keeps_progress_when_file_is_invalid(progress_file: Path) -> None:
+    controller = ProgressController(filepath=str(progress_file))
+    watcher = ProgressWatcher(controller, lambda changes: None)
+
+    progress_file.write_text("{ half written", encoding="utf-8")
+
+    assert watcher.check() == {}
+    assert controller.get_unlocked_level() == 3
+
+    progress_file.write_text(json.dumps({"unlocked_level": 4}), encoding="utf-8")
+    touch(progress_file)
+
+    assert watcher.check()["unlocked_level"] == (3, 4)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        '{"unlocked_level": "3"}',
+        '{"completed_levels": [1, "2"]}',
+        '{"settings": []}',
+        '{"settings": {"volume": 3}}',
+        '{"difficulty": {"two": {"samples": 1}}}',
+        '{"difficulty": {"0": {"samples": 1}}}',
+    ],
+)
+def test_check_rejects_progress_with_invalid_types(
+    progress_file: Path, content: str
+) -> None:
+    controller = ProgressController(filepath=str(progress_file))
+    notified = []
+    watcher = ProgressWatcher(controller, notified.append)
+
+    progress_file.write_text(content, encoding="utf-8")
+    touch(progress_file)
+
+    assert watcher.check() == {}
+    assert watcher.check() == {}
+    assert notified == []
+    assert controller.get_unlocked_level() == 3
+    assert controller.get_completed_levels() == [1, 2]
+
+
+def test_check_reports_external_changes_merged_by_own_save(
+    progress_file: Path,
+) -> None:
+    controller = ProgressController(filepath=str(progress_file))
+    notified = []
+    watcher = ProgressWatcher(controller, notified.append)
+
+    edit_externally(progress_file, settings={"sounds": True, "language": "en"})
+    controller.complete_level(level=3, score=7)
+    changes = watcher.check()
+
+    assert changes == {"settings.language": ("es", "en")}
+    assert notified == [changes]
+    assert controller.get_settings().language == "en"
+    assert watcher.check() == {}
@@ -1,14 +1,32 @@
 import logging
 import tkinter as tk
 
+from .resource_manager import resource_manager
+
+IMAGES_PER_LEVEL = 3
+
+
+def image_path(level: int, index: int) -> str:
+    return f"assets/images/level{level}_img{index + 1}.png"
+
+
 def load_images_for_level(level: int) -> list[tk.PhotoImage]:
     """Load 3 images for a given level from assets/images."""
     images = []
-    for i in range(3):
-        path = f"assets/images/level{level}_img{i+1}.png"
+    for i in range(IMAGES_PER_LEVEL):
+        path = image_path(level, i)
         try:
-            img = tk.PhotoImage(file=path)
+            img = resource_manager.acquire_image(path)
             images.append(img)
         except Exception as e:
             logging.error(f"Failed to load image {path}: {e}")
-    return images
\ No newline at end of file
+    return images
+
+
+def release_images_for_level(level: int) -> None:
+    """Release the images acquired by `load_images_for_level`."""
+    for i in range(IMAGES_PER_LEVEL):
+        path = image_path(level, i)
+        if resource_manager.has_image(path):
+            resource_manager.release_image(path)
+    logging.info(f"Resource usage after level {level}: {resource_manager.stats()}")
@@ -0,0 +1,146 @@
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from .image_handler import IMAGES_PER_LEVEL, image_path, release_images_for_level
+from .resource_manager import resource_manager
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class LevelLoadCancelled(Exception):
+    pass
+
+
+@dataclass
+class LevelLoad:
+    level: int
+    on_ready: Callable[[list], None]
+    on_finished: Callable[[], None]
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+
+class LevelLoader:
+    """
+    Load level assets in stages without blocking the Tk event loop:
+    the catalog is resolved and the files are fetched in a worker thread,
+    then the images are built on the Tk thread.
+    Starting a new load cancels the one in progress.
+    """
+
+    POLL_MS = 20
+
+    def __init__(self, root):
+        self.root = root
+        self.current: Optional[LevelLoad] = None
+        self._results: queue.Queue = queue.Queue()
+        self._polling = False
+
+    def load(
+        self,
+        level: int,
+        on_ready: Callable[[list], None],
+        on_finished: Callable[[], None] = lambda: None,
+    ) -> LevelLoad:
+        """
+        Load the images of `level` and call `on_ready` with them on the Tk thread.
+        `on_finished` is always called once the load ends, even if it is
+        cancelled or fails, so callers can close their loading placeholder.
+        """
+        self.cancel()
+        request = LevelLoad(level, on_ready, on_finished)
+        self.current = request
+        threading.Thread(target=self._fetch, args=(request,), daemon=True).start()
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        return request
+
+    def cancel(self) -> None:
+        """Cancel the load in progress, if any."""
+        if self.current is not None:
+            logging.info(f"Loading of level {self.current.level} cancelled.")
+            self.current.cancelled.set()
+            self.current.on_finished()
+            self.current = None
+
+    def _fetch(self, request: LevelLoad) -> None:
+        try:
+            paths = resolve_catalog(request.level)
+            blobs = []
+            for path in paths:
+                if request.cancelled.is_set():
+                    raise LevelLoadCancelled()
+                blobs.append(fetch_image(path))
+            self._results.put((request, list(zip(paths, blobs)), None))
+        except LevelLoadCancelled:
+            pass
+        except Exception as e:
+            self._results.put((request, None, e))
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                request, assets, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(request, assets, error)
+
+        if self.current is None and self._results.empty():
+            self._polling = False
+        else:
+            self.root.after(self.POLL_MS, self._poll)
+
+    def _finish(
+        self,
+        request: LevelLoad,
+        assets: Optional[List[Tuple[str, bytes]]],
+        error: Optional[Exception],
+    ) -> None:
+        if request.cancelled.is_set() or request is not self.current:
+            return
+        self.current = None
+        request.on_finished()
+
+        if error is not None:
+            logging.error(f"Failed to load level {request.level}: {error}")
+            return
+
+        images = build_images(assets)
+        if len(images) < IMAGES_PER_LEVEL:
+            logging.error(f"Not enough images to start level {request.level}")
+            release_images_for_level(request.level)
+            return
+        request.on_ready(images)
+
+
+def resolve_catalog(level: int) -> List[str]:
+    """Return the image paths of a level, checking that all of them exist."""
+    paths = [image_path(level, i) for i in range(IMAGES_PER_LEVEL)]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"Missing images for level {level}: {missing}")
+    return paths
+
+
+def fetch_image(path: str) -> bytes:
+    """Read an image file and validate it is a PNG."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"Invalid PNG file: {path}")
+    return data
+
+
+def build_images(assets: List[Tuple[str, bytes]]) -> list:
+    """Decode the fetched images. Must run on the Tk thread."""
+    images = []
+    for path, data in assets:
+        try:
+            images.append(resource_manager.acquire_image(path, data))
+        except Exception as e:
+            logging.error(f"Failed to load image {path}: {e}")
+    return images
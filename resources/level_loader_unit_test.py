@@ -0,0 +1,105 @@
+import threading
+import time
+from pathlib import Path
+import pytest
+from resources import image_handler, level_loader
+from resources.level_loader import LevelLoader, fetch_image, resolve_catalog
+from resources.resource_manager import ResourceManager
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+
+    def run_until_idle(self, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.callbacks and time.monotonic() < deadline:
+            self.callbacks.pop(0)()
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def patched_resource_manager(monkeypatch: pytest.MonkeyPatch) -> ResourceManager:
+    """Build (path, data) pairs instead of Tk images."""
+    manager = ResourceManager(
+        image_loader=lambda path, data=None: (path, data),
+        image_size=lambda image: len(image[1]),
+        image_release=lambda image: None,
+    )
+    monkeypatch.setattr(image_handler, "resource_manager", manager)
+    monkeypatch.setattr(level_loader, "resource_manager", manager)
+    return manager
+
+
+def test_resolve_catalog_returns_existing_level_images():
+    paths = resolve_catalog(1)
+    assert paths == [f"assets/images/level1_img{i}.png" for i in (1, 2, 3)]
+
+
+def test_resolve_catalog_raises_error_for_missing_level():
+    with pytest.raises(FileNotFoundError, match="Missing images for level 99"):
+        resolve_catalog(99)
+
+
+def test_fetch_image_rejects_files_that_are_not_png(tmp_path: Path):
+    path = tmp_path / "fake.png"
+    path.write_bytes(b"not a png")
+
+    with pytest.raises(ValueError, match="Invalid PNG file"):
+        fetch_image(str(path))
+
+
+def test_new_load_cancels_the_one_in_progress(
+    patched_resource_manager: ResourceManager,
+):
+    root = FakeRoot()
+    loader = LevelLoader(root)
+    finished = []
+    ready = []
+
+    loader.load(1, on_ready=ready.append, on_finished=lambda: finished.append(1))
+    loader.load(2, on_ready=ready.append, on_finished=lambda: finished.append(2))
+    root.run_until_idle()
+
+    assert finished == [1, 2]
+    assert [[path for path, _ in images] for images in ready] == [resolve_catalog(2)]
+    assert patched_resource_manager.stats()["resources"] == 3
+    assert loader.current is None
+
+
+def test_fetch_finishing_after_its_load_was_replaced_is_dropped(
+    monkeypatch: pytest.MonkeyPatch, patched_resource_manager: ResourceManager
+):
+    stale_fetch_started = threading.Event()
+    release_stale_fetch = threading.Event()
+
+    def slow_fetch_image(path: str) -> bytes:
+        if path == "assets/images/level1_img3.png":
+            stale_fetch_started.set()
+            release_stale_fetch.wait(timeout=2)
+        return fetch_image(path)
+
+    monkeypatch.setattr(level_loader, "fetch_image", slow_fetch_image)
+    root = FakeRoot()
+    loader = LevelLoader(root)
+    ready = []
+
+    loader.load(1, on_ready=ready.append)
+    # Replace the load once its worker is past the last cancellation check.
+    assert stale_fetch_started.wait(timeout=2)
+    loader.load(2, on_ready=ready.append)
+    release_stale_fetch.set()
+    # Both workers deliver their results before the loader polls them.
+    deadline = time.monotonic() + 2
+    while loader._results.qsize() < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert loader._results.qsize() == 2
+    root.run_until_idle()
+
+    assert [[path for path, _ in images] for images in ready] == [resolve_catalog(2)]
+    assert not any(
+        patched_resource_manager.has_image(path) for path in resolve_catalog(1)
+    )
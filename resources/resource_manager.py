@@ -0,0 +1,170 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class Resource:
+    value: Any
+    size: int
+    release: Callable[[Any], None]
+    refcount: int = 0
+
+
+def _load_photo_image(path: str, data: Optional[bytes] = None) -> Any:
+    import tkinter as tk
+
+    if data is not None:
+        return tk.PhotoImage(data=data)
+    return tk.PhotoImage(file=path)
+
+
+def _photo_image_size(image: Any) -> int:
+    # Tk stores photo images as 32-bit RGBA pixels.
+    return image.width() * image.height() * 4
+
+
+def _delete_photo_image(image: Any) -> None:
+    image.tk.call("image", "delete", image.name)
+
+
+def _load_sound(path: str) -> Any:
+    import pygame
+
+    return pygame.mixer.Sound(path)
+
+
+def _sound_size(sound: Any) -> int:
+    import pygame
+
+    frequency, bits, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(bits) // 8)
+
+
+def _stop_sound(sound: Any) -> None:
+    sound.stop()
+
+
+class ResourceManager:
+    """
+    Reference-count images and sounds shared across levels.
+    Resources are released as soon as their last user goes away and the
+    estimated memory in use can never exceed the configured budget.
+    """
+
+    DEFAULT_BUDGET = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_BUDGET,
+        image_loader: Callable[..., Any] = _load_photo_image,
+        image_size: Callable[[Any], int] = _photo_image_size,
+        image_release: Callable[[Any], None] = _delete_photo_image,
+        sound_loader: Callable[[str], Any] = _load_sound,
+        sound_size: Callable[[Any], int] = _sound_size,
+        sound_release: Callable[[Any], None] = _stop_sound,
+    ):
+        self.budget = budget
+        self.image_loader = image_loader
+        self.image_size = image_size
+        self.image_release = image_release
+        self.sound_loader = sound_loader
+        self.sound_size = sound_size
+        self.sound_release = sound_release
+        self._resources: Dict[Tuple[str, str], Resource] = {}
+        self._usage = 0
+        self._loaded = 0
+        self._released = 0
+
+    def acquire_image(self, path: str, data: Optional[bytes] = None) -> Any:
+        """
+        Return the image at `path`, loading it on first use.
+        `data` holds the already fetched file contents, if any.
+        """
+        load = (
+            (lambda: self.image_loader(path, data))
+            if data is not None
+            else (lambda: self.image_loader(path))
+        )
+        return self._acquire(("image", path), load, self.image_size, self.image_release)
+
+    def release_image(self, path: str) -> None:
+        self._release(("image", path))
+
+    def has_image(self, path: str) -> bool:
+        return ("image", path) in self._resources
+
+    def acquire_sound(self, path: str) -> Any:
+        """Return the sound at `path`, loading it on first use."""
+        return self._acquire(
+            ("sound", path),
+            lambda: self.sound_loader(path),
+            self.sound_size,
+            self.sound_release,
+        )
+
+    def release_sound(self, path: str) -> None:
+        self._release(("sound", path))
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current memory usage and resource counters."""
+        return {
+            "usage": self._usage,
+            "budget": self.budget,
+            "resources": len(self._resources),
+            "references": sum(r.refcount for r in self._resources.values()),
+            "loaded": self._loaded,
+            "released": self._released,
+        }
+
+    def release_all(self) -> None:
+        """Release every resource regardless of its reference count."""
+        for key in list(self._resources):
+            self._free(key)
+
+    def _acquire(
+        self,
+        key: Tuple[str, str],
+        load: Callable[[], Any],
+        size_of: Callable[[Any], int],
+        release: Callable[[Any], None],
+    ) -> Any:
+        resource = self._resources.get(key)
+        if resource is None:
+            path = key[1]
+            value = load()
+            size = size_of(value)
+            if self._usage + size > self.budget:
+                release(value)
+                raise RuntimeError(
+                    f"Memory budget exceeded loading {path}: "
+                    f"{self._usage + size} > {self.budget} bytes"
+                )
+            resource = self._resources[key] = Resource(value, size, release)
+            self._usage += size
+            self._loaded += 1
+            logging.debug(f"Loaded {path} ({size} bytes), usage {self._usage} bytes.")
+        resource.refcount += 1
+        return resource.value
+
+    def _release(self, key: Tuple[str, str]) -> None:
+        resource = self._resources.get(key)
+        if resource is None:
+            logging.warning(f"Release of unknown resource {key[1]} ignored.")
+            return
+        resource.refcount -= 1
+        if resource.refcount <= 0:
+            self._free(key)
+
+    def _free(self, key: Tuple[str, str]) -> None:
+        resource = self._resources.pop(key)
+        try:
+            resource.release(resource.value)
+        except Exception as e:
+            logging.error(f"Failed to release {key[1]}: {e}")
+        self._usage -= resource.size
+        self._released += 1
+        logging.debug(f"Released {key[1]}, usage {self._usage} bytes.")
+
+
+resource_manager = ResourceManager()
@@ -0,0 +1,174 @@
+import gc
+import tkinter as tk
+import tracemalloc
+from typing import Generator, Optional
+import pytest
+from game.sequence import SequenceRound
+from game.session import SessionRecorder
+from resources import image_handler
+from resources.image_handler import (
+    IMAGES_PER_LEVEL,
+    load_images_for_level,
+    release_images_for_level,
+)
+from resources.resource_manager import ResourceManager
+from ui.playing_level import PlayingLevelUI
+
+
+class FakeImage:
+    def __init__(self, path: str, data: Optional[bytes] = None):
+        self.path = path
+        self.pixels = bytearray(64 * 64 * 4)
+        self.deleted = False
+
+    def delete(self) -> None:
+        self.deleted = True
+        self.pixels = bytearray()
+
+
+def make_manager(budget: int = ResourceManager.DEFAULT_BUDGET) -> ResourceManager:
+    return ResourceManager(
+        budget=budget,
+        image_loader=FakeImage,
+        image_size=lambda img: len(img.pixels),
+        image_release=FakeImage.delete,
+    )
+
+
+@pytest.fixture
+def patched_resource_manager(monkeypatch: pytest.MonkeyPatch) -> ResourceManager:
+    """Make the shared resource manager load stand-in images."""
+    manager = make_manager()
+    monkeypatch.setattr(image_handler, "resource_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def tk_root() -> Generator[tk.Tk, None, None]:
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Tk needs a display")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+CORRECT_ORDER = [0, 1, 2]
+
+
+def play_level(level: int, seed: int) -> None:
+    """
+    Play a level the way the level window does, without Tk: select the
+    images with one wrong attempt, record the clicks, then run the
+    `on_close` callback main.py gives the window.
+    """
+    images = load_images_for_level(level)
+    assert len(images) == IMAGES_PER_LEVEL
+
+    def on_close() -> None:
+        release_images_for_level(level)
+
+    round_ = SequenceRound(CORRECT_ORDER, seed)
+    recorder = SessionRecorder(level, round_.seed, CORRECT_ORDER)
+    clicks = list(reversed(CORRECT_ORDER)) + CORRECT_ORDER
+    for step, image_idx in enumerate(clicks):
+        if round_.select(image_idx):
+            recorder.click(image_idx, step * 0.5)
+        if round_.is_full():
+            round_.validate()
+    assert round_.completed
+    recording = recorder.finish(2.5, round_.errors, score=10)
+    assert recording.errors == 1
+
+    on_close()
+    assert all(image.deleted for image in images)
+
+
+def test_images_are_shared_and_released_with_last_reference():
+    manager = make_manager()
+
+    first = manager.acquire_image("a.png")
+    second = manager.acquire_image("a.png")
+    assert first is second
+    assert manager.stats()["references"] == 2
+
+    manager.release_image("a.png")
+    assert not first.deleted
+
+    manager.release_image("a.png")
+    assert first.deleted
+    assert manager.stats()["usage"] == 0
+
+
+def test_acquire_raises_error_when_budget_is_exceeded():
+    manager = make_manager(budget=64 * 64 * 4)
+    manager.acquire_image("a.png")
+
+    with pytest.raises(RuntimeError, match="Memory budget exceeded"):
+        manager.acquire_image("b.png")
+
+    assert manager.stats()["resources"] == 1
+
+
+def test_soak_10000_levels_keeps_memory_flat(
+    patched_resource_manager: ResourceManager,
+):
+    for level in range(100):
+        play_level(level % 5 + 1, seed=level)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for level in range(10_000):
+        play_level(level % 5 + 1, seed=level)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = patched_resource_manager.stats()
+    assert stats["usage"] == 0
+    assert stats["resources"] == 0
+    assert stats["loaded"] == stats["released"] == 30_300
+    assert current - baseline < 64 * 1024
+
+
+def test_completing_and_closing_level_windows_releases_images(
+    monkeypatch: pytest.MonkeyPatch, tk_root: tk.Tk
+):
+    manager = ResourceManager()
+    monkeypatch.setattr(image_handler, "resource_manager", manager)
+    completed = []
+
+    for played in range(1_000):
+        level = played % 5 + 1
+        images = load_images_for_level(level)
+        names = {str(image) for image in images}
+        window = PlayingLevelUI(
+            tk_root,
+            level,
+            images,
+            CORRECT_ORDER,
+            lambda level_completed, duration: completed.append(level_completed),
+            on_close=lambda level=level: release_images_for_level(level),
+            seed=played,
+            feedback=False,
+        )
+        window.validate_delay_ms = 0
+        tk_root.update()
+        if played % 2 == 0:
+            for image_idx in CORRECT_ORDER:
+                button = window.image_buttons[window.shuffled_indices.index(image_idx)]
+                button.invoke()
+            tk_root.update()
+        else:
+            # Same command Tk runs when the title-bar X is clicked.
+            handler = tk_root.tk.call("wm", "protocol", window._w, "WM_DELETE_WINDOW")
+            tk_root.tk.eval(handler)
+        del images, window
+        assert names.isdisjoint(tk_root.image_names())
+
+    assert len(completed) == 500
+    assert manager.stats()["usage"] == 0
+    assert manager.stats()["resources"] == 0
+    assert not tk_root.children
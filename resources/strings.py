@@ -0,0 +1,108 @@
+import json
+import logging
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+LOCALES_DIR = Path(__file__).parent / "locales"
+DEFAULT_LOCALE = "es"
+
+# (option, key, format arguments) bound to a widget
+Binding = Tuple[str, str, Dict[str, Any]]
+
+
+class StringCatalog:
+    """
+    UI strings for every locale, loaded once into flat lookup tables.
+    Widgets bound through the catalog are retranslated in place when the
+    locale changes, so switching language does not rebuild any window.
+    """
+
+    def __init__(self, directory: Path = LOCALES_DIR, locale: str = DEFAULT_LOCALE):
+        self.tables = self._load_tables(directory)
+        if locale not in self.tables:
+            raise ValueError(f"Unknown locale: {locale}")
+        self.locale = locale
+        self._table = self.tables[locale]
+        self._bindings: "weakref.WeakKeyDictionary[Any, List[Binding]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._fonts: Dict[tuple, Any] = {}
+        self._metrics: Dict[str, Dict[Tuple[tuple, str], int]] = {}
+
+    @property
+    def locales(self) -> List[str]:
+        return sorted(self.tables)
+
+    def get(self, key: str, **kwargs) -> str:
+        """Return the text of `key` in the current locale."""
+        template = self._table[key]
+        return template.format(**kwargs) if kwargs else template
+
+    def bind(self, widget, key: str, option: str = "text", **kwargs) -> str:
+        """
+        Set a widget option (or its window title with option="title") to the
+        text of `key` and keep it translated when the locale changes.
+        """
+        self._bindings.setdefault(widget, []).append((option, key, kwargs))
+        text = self.get(key, **kwargs)
+        self._apply(widget, option, text)
+        return text
+
+    def set_locale(self, locale: str) -> None:
+        """Switch language, updating the text of every bound widget."""
+        if locale not in self.tables:
+            raise ValueError(f"Unknown locale: {locale}")
+        if locale == self.locale:
+            return
+        self.locale = locale
+        self._table = self.tables[locale]
+        for widget, bindings in list(self._bindings.items()):
+            if not widget.winfo_exists():
+                del self._bindings[widget]
+                continue
+            for option, key, kwargs in bindings:
+                self._apply(widget, option, self.get(key, **kwargs))
+        logging.info(f"Locale changed to {locale}.")
+
+    def text_width(self, font: tuple, text: str) -> int:
+        """Return the width in pixels of `text`, cached per locale."""
+        metrics = self._metrics.setdefault(self.locale, {})
+        width = metrics.get((font, text))
+        if width is None:
+            width = metrics[(font, text)] = self._font(font).measure(text)
+        return width
+
+    def _font(self, font: tuple):
+        tk_font = self._fonts.get(font)
+        if tk_font is None:
+            import tkinter.font as tkfont
+
+            tk_font = self._fonts[font] = tkfont.Font(font=font)
+        return tk_font
+
+    @staticmethod
+    def _apply(widget, option: str, text: str) -> None:
+        if option == "title":
+            widget.title(text)
+        else:
+            widget.configure({option: text})
+
+    @staticmethod
+    def _load_tables(directory: Path) -> Dict[str, Dict[str, str]]:
+        tables: Dict[str, Dict[str, str]] = {}
+        for path in sorted(Path(directory).glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                tables[path.stem] = json.load(f)
+
+        default = tables.get(DEFAULT_LOCALE, {})
+        for locale, table in tables.items():
+            missing = default.keys() - table.keys()
+            if missing:
+                logging.warning(f"Locale {locale} is missing {sorted(missing)}.")
+            # Fall back to the default locale so a lookup is a single dict access.
+            tables[locale] = {**default, **table}
+        return tables
+
+
+strings = StringCatalog()
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+import pytest
+from resources.strings import LOCALES_DIR, StringCatalog
+
+
+class FakeWidget:
+    def __init__(self):
+        self.options = {}
+        self.exists = True
+
+    def configure(self, options):
+        self.options.update(options)
+
+    def title(self, text):
+        self.options["title"] = text
+
+    def winfo_exists(self):
+        return self.exists
+
+
+def test_all_locales_define_the_same_keys():
+    tables = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in LOCALES_DIR.glob("*.json")
+    ]
+    assert len(tables) >= 2
+    assert all(table.keys() == tables[0].keys() for table in tables)
+
+
+def test_get_formats_text_in_current_locale():
+    catalog = StringCatalog(locale="en")
+    assert catalog.get("level.title", level=3) == "Level 3"
+
+
+def test_set_locale_rebinds_widget_text_in_place():
+    catalog = StringCatalog(locale="es")
+    label = FakeWidget()
+    window = FakeWidget()
+    catalog.bind(label, "menu.level", emoji="🎈", level=2)
+    catalog.bind(window, "level.title", option="title", level=2)
+    assert label.options["text"] == "🎈 Nivel 2 🎈"
+
+    catalog.set_locale("en")
+
+    assert label.options["text"] == "🎈 Level 2 🎈"
+    assert window.options["title"] == "Level 2"
+
+
+def test_set_locale_skips_destroyed_widgets():
+    catalog = StringCatalog(locale="es")
+    label = FakeWidget()
+    catalog.bind(label, "level.select_order")
+    label.exists = False
+
+    catalog.set_locale("en")
+
+    assert label.options["text"] == "Selecciona el orden:"
+
+
+def test_missing_keys_fall_back_to_default_locale(tmp_path: Path):
+    (tmp_path / "es.json").write_text(
+        json.dumps({"a": "uno", "b": "dos"}), encoding="utf-8"
+    )
+    (tmp_path / "en.json").write_text(json.dumps({"a": "one"}), encoding="utf-8")
+
+    catalog = StringCatalog(directory=tmp_path, locale="en")
+
+    assert catalog.get("a") == "one"
+    assert catalog.get("b") == "dos"
+
+
+def test_unknown_locale_raises_error():
+    with pytest.raises(ValueError, match="Unknown locale: fr"):
+        StringCatalog(locale="fr")
@@ -0,0 +1,20 @@
+import tkinter as tk
+
+from resources.strings import strings
+
+
+class LoadingUI(tk.Toplevel):
+    def __init__(self, master, level_number: int):
+        super().__init__(master)
+        strings.bind(self, "level.title", option="title", level=level_number)
+        self.configure(bg="#FFF6E5")
+        self.resizable(False, False)
+
+        label = tk.Label(
+            self,
+            font=("Comic Sans MS", 18, "bold"),
+            bg="#FFF6E5",
+            fg="#5D5D5D",
+        )
+        strings.bind(label, "loading.message", level=level_number)
+        label.pack(padx=30, pady=30)
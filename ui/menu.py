@@ -1,6 +1,8 @@
 import tkinter as tk
 import logging
-from typing import Callable, List
+from typing import Callable, Dict, List
+
+from resources.strings import strings
 
 
 class MenuUI(tk.Tk):
@@ -8,6 +10,8 @@ class MenuUI(tk.Tk):
     BUTTON_WIDTH = 20
     BUTTON_HEIGHT = 6
     GRID_COLUMNS = 5
+    WRAP_LENGTH = 140
+    BUTTON_FONT = ("Comic Sans MS", 18, "bold")
 
     # Paleta pastel para los botones, colores más suaves pero variados
     LEVEL_COLORS = [
@@ -27,16 +31,20 @@ class MenuUI(tk.Tk):
 
     def __init__(self, controller, start_level_callback: Callable[[int], None]):
         super().__init__()
-        self.title("🎮 Menu Juego para Ordenar 🎉")
         self.controller = controller
         self.start_level_callback = start_level_callback
+        # Ancho de ajuste de texto calculado una sola vez por idioma
+        self._wrap_lengths: Dict[str, int] = {}
+        self.level_buttons: List[tk.Button] = []
+
+        self.apply_language(controller.get_settings().language)
+        strings.bind(self, "menu.title", option="title")
 
         # Fondo amarillo pastel suave
         self.configure(bg="#FFF9E3")
 
-        self.level_buttons: List[tk.Button] = []
-
         self.create_widgets()
+        self.create_language_button()
 
     def create_widgets(self) -> None:
         unlocked_levels = self.controller.get_unlocked_levels()
@@ -45,23 +53,35 @@ class MenuUI(tk.Tk):
         for level in range(1, self.MAX_LEVELS + 1):
             self.create_level_button(level, level in unlocked_levels)
 
+    def refresh_menu(self) -> None:
+        for btn in self.level_buttons:
+            btn.destroy()
+        self.level_buttons.clear()
+        self.create_widgets()
+
+    def on_progress_changed(self, changes: dict) -> None:
+        """Refresh the level buttons when progress is modified outside the game."""
+        if "settings.language" in changes:
+            self.apply_language(changes["settings.language"][1])
+        if {"unlocked_level", "completed_levels"} & changes.keys():
+            self.refresh_menu()
+
     def create_level_button(self, level: int, is_unlocked: bool) -> None:
         emoji = self.LEVEL_EMOJIS[(level - 1) % len(self.LEVEL_EMOJIS)]
-        btn_text = f"{emoji} Level {level} {emoji}"
         btn = tk.Button(
             self,
-            text=btn_text,
             width=self.BUTTON_WIDTH,
             height=self.BUTTON_HEIGHT,
-            font=("Comic Sans MS", 18, "bold"),
+            font=self.BUTTON_FONT,
             relief=tk.RAISED,
             bd=5,
             fg="#222222",  # texto oscuro para buen contraste
             activeforeground="#222222",
-            wraplength=140,
+            wraplength=self.wrap_length(),
             justify=tk.CENTER,
             cursor="hand2",
         )
+        strings.bind(btn, "menu.level", emoji=emoji, level=level)
 
         bg_color = self.LEVEL_COLORS[(level - 1) % len(self.LEVEL_COLORS)]
 
@@ -84,6 +104,52 @@ class MenuUI(tk.Tk):
 
         self.level_buttons.append(btn)
 
+    def create_language_button(self) -> None:
+        self.language_button = tk.Button(
+            self,
+            font=("Comic Sans MS", 14),
+            bg="#FFF9E3",
+            relief=tk.FLAT,
+            cursor="hand2",
+            command=self.switch_language,
+        )
+        strings.bind(self.language_button, "menu.switch_language")
+        rows = (self.MAX_LEVELS - 1) // self.GRID_COLUMNS + 1
+        self.language_button.grid(row=rows, column=self.GRID_COLUMNS - 1, pady=10)
+
+    def switch_language(self) -> None:
+        locales = strings.locales
+        locale = locales[(locales.index(strings.locale) + 1) % len(locales)]
+        self.apply_language(locale)
+        self.controller.update_settings(language=locale)
+
+    def apply_language(self, locale: str) -> None:
+        """Retranslate the open windows in place."""
+        if locale not in strings.locales:
+            logging.warning(f"Unsupported language {locale}, keeping {strings.locale}.")
+            return
+        strings.set_locale(locale)
+        wrap_length = self.wrap_length()
+        for btn in self.level_buttons:
+            btn.config(wraplength=wrap_length)
+
+    def wrap_length(self) -> int:
+        """
+        Return the text wrap length of the level buttons for the current locale,
+        wide enough to never split the longest word of a label.
+        """
+        wrap_length = self._wrap_lengths.get(strings.locale)
+        if wrap_length is None:
+            label = strings.get(
+                "menu.level", emoji=self.LEVEL_EMOJIS[0], level=self.MAX_LEVELS
+            )
+            widest = max(
+                strings.text_width(self.BUTTON_FONT, word) for word in label.split()
+            )
+            wrap_length = max(self.WRAP_LENGTH, widest)
+            self._wrap_lengths[strings.locale] = wrap_length
+        return wrap_length
+
     def _darker_color(self, hex_color: str, factor: float) -> str:
         """Devuelve un color más oscuro aplicando factor (0..1) a un color hex pastel."""
         hex_color = hex_color.lstrip("#")
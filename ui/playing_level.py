@@ -1,8 +1,12 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
 import logging
-from typing import List, Callable
+import time
+from typing import List, Callable, Optional
+
+from game.sequence import SequenceRound
+from game.session import SessionRecorder
+from resources.strings import strings
 
 
 class PlayingLevelUI(tk.Toplevel):
@@ -12,34 +16,50 @@ class PlayingLevelUI(tk.Toplevel):
         level_number: int,
         images: List[tk.PhotoImage],
         correct_order: List[int],
-        on_level_complete: Callable[[int], None],
+        on_level_complete: Callable[[int, float], None],
+        on_close: Optional[Callable[[], None]] = None,
+        seed: Optional[int] = None,
+        feedback: bool = True,
     ):
         super().__init__(master)
-        self.title(f"Nivel {level_number}")
+        strings.bind(self, "level.title", option="title", level=level_number)
         self.configure(bg="#FFF6E5")  # Fondo cálido tipo pastel
         self.level_number = level_number
         self.images = images
         self.correct_order = correct_order
         self.on_level_complete = on_level_complete
-
-        self.selected_order: List[int] = []
+        self.on_close = on_close
+        # Los mensajes se pueden desactivar para reproducir sesiones grabadas
+        self.feedback = feedback
+        self.validate_delay_ms = 500
+
+        self.round = SequenceRound(correct_order, seed)
+        self.recorder = SessionRecorder(level_number, self.round.seed, correct_order)
+        # El reloj de puntaje arranca cuando la ventana se dibuja por primera vez,
+        # o al crearla si nunca llega a dibujarse
+        self.created_at = time.monotonic()
+        self.start_time: Optional[float] = None
+        # Tiempo del clic que completó la secuencia, sin contar la validación
+        self.completed_elapsed = 0.0
 
         self.setup_ui()
+        self.bind("<Expose>", self._on_first_paint, add="+")
+        # Cerrar con la X de la ventana también debe liberar las imágenes
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
 
     def setup_ui(self):
         # Título de nivel
         label = tk.Label(
             self,
-            text=f"Nivel {self.level_number}",
             font=("Comic Sans MS", 24, "bold"),
             bg="#FFF6E5",
             fg="#5D5D5D",
         )
+        strings.bind(label, "level.title", level=self.level_number)
         label.pack(pady=10)
 
-        # Mezclar imágenes para mostrar
-        self.shuffled_indices = list(range(len(self.images)))
-        random.shuffle(self.shuffled_indices)
+        # Imágenes mezcladas con la semilla de la ronda
+        self.shuffled_indices = self.round.shuffled_indices
 
         # Contenedor para imágenes
         self.buttons_frame = tk.Frame(self, bg="#FFF6E5")
@@ -62,28 +82,50 @@ class PlayingLevelUI(tk.Toplevel):
         # Texto de selección
         self.selection_label = tk.Label(
             self,
-            text="Selecciona el orden:",
             font=("Comic Sans MS", 16),
             bg="#FFF6E5",
             fg="#5D5D5D",
         )
+        strings.bind(self.selection_label, "level.select_order")
         self.selection_label.pack(pady=10)
 
         # Vista previa del orden
         self.selected_order_frame = tk.Frame(self, bg="#FFF6E5")
         self.selected_order_frame.pack(pady=5)
 
+    def _on_first_paint(self, event=None):
+        if self.start_time is None:
+            self.start_time = time.monotonic()
+            logging.info(f"Nivel {self.level_number} visible, comienza el reloj.")
+
+    def elapsed_seconds(self) -> float:
+        """Return the seconds elapsed since the level was first shown."""
+        start_time = self.start_time
+        if start_time is None:
+            start_time = self.created_at
+        return time.monotonic() - start_time
+
+    @property
+    def selected_order(self) -> List[int]:
+        return self.round.selected_order
+
+    @property
+    def errors(self) -> int:
+        return self.round.errors
+
     def image_clicked(self, image_idx):
-        if len(self.selected_order) >= len(self.images):
+        if not self.round.select(image_idx):
             return
 
         logging.info(f"Imagen seleccionada: {image_idx}")
-        self.selected_order.append(image_idx)
+        elapsed = self.elapsed_seconds()
+        self.recorder.click(image_idx, elapsed)
         self.update_selected_order_view()
 
-        if len(self.selected_order) == len(self.images):
+        if self.round.is_full():
+            self.completed_elapsed = elapsed
             self.after(
-                500, self.validate_order
+                self.validate_delay_ms, self.validate_order
             )  # Dar un respiro de 0.5s antes de validar
 
     def update_selected_order_view(self):
@@ -103,14 +145,30 @@ class PlayingLevelUI(tk.Toplevel):
     def validate_order(self):
         logging.info(f"Validando orden: {self.selected_order} vs {self.correct_order}")
 
-        if self.selected_order == self.correct_order:
-            messagebox.showinfo("¡Muy bien!", "🎉 ¡Has ordenado correctamente!")
-            self.on_level_complete(self.level_number)
+        if self.round.validate():
+            if self.feedback:
+                messagebox.showinfo(
+                    strings.get("level.success.title"),
+                    strings.get("level.success.message"),
+                )
+            self.on_level_complete(self.level_number, self.completed_elapsed)
             self.destroy()
         else:
-            messagebox.showerror("Inténtalo de nuevo", "❌ El orden no es correcto.")
+            if self.feedback:
+                messagebox.showerror(
+                    strings.get("level.retry.title"),
+                    strings.get("level.retry.message"),
+                )
             self.reset_level()
 
     def reset_level(self):
-        self.selected_order = []
         self.update_selected_order_view()
+
+    def destroy(self):
+        super().destroy()
+        # Soltar las referencias para que las imágenes puedan liberarse
+        self.images = []
+        self.image_buttons = []
+        if self.on_close is not None:
+            on_close, self.on_close = self.on_close, None
+            on_close()
@@ -0,0 +1,60 @@
+import logging
+import time
+from typing import Callable, List, Optional
+
+from game.session import ReplayReport, SessionRecording, compare_outcome
+from .playing_level import PlayingLevelUI
+
+
+def replay_in_window(
+    window: PlayingLevelUI,
+    recording: SessionRecording,
+    speed: float = 10.0,
+    on_done: Optional[Callable[[ReplayReport], None]] = None,
+) -> None:
+    """
+    Replay the clicks of a recording through the real buttons of `window`,
+    `speed` times faster than they were recorded. The window must be created
+    with the recording's seed and `feedback=False` so no dialog blocks the replay.
+    `on_done` receives the report comparing the outcome with the recording,
+    with the time in seconds each click took to be handled.
+    """
+    if window.round.seed != recording.seed:
+        raise ValueError("The window was not created with the recording seed.")
+
+    root = window.master
+    window.validate_delay_ms = max(1, int(window.validate_delay_ms / speed))
+    step_times: List[float] = []
+
+    def finish() -> None:
+        # Only accepted clicks are recorded, so the replayed window must
+        # accept the same clicks and the last one completes the round.
+        replayed = [idx for _, idx in window.recorder.recording.clicks]
+        completing_click = len(replayed) - 1 if window.round.completed else None
+        report = compare_outcome(recording, window.round, completing_click, step_times)
+        if replayed != [idx for _, idx in recording.clicks]:
+            report.mismatches.append(f"clicks {replayed} != {recording.clicks}")
+        if on_done is not None:
+            on_done(report)
+
+    def click(image_idx: int) -> None:
+        if window.winfo_exists():
+            button = window.image_buttons[window.shuffled_indices.index(image_idx)]
+            step_start = time.perf_counter()
+            button.invoke()
+            window.update_idletasks()
+            step_times.append(time.perf_counter() - step_start)
+        else:
+            step_times.append(0.0)
+        if len(step_times) == len(recording.clicks):
+            root.after(window.validate_delay_ms + 1, finish)
+
+    if not recording.clicks:
+        root.after(0, finish)
+    # Scheduled on the root, since the window is destroyed once completed.
+    for elapsed_ms, image_idx in recording.clicks:
+        root.after(int(elapsed_ms / speed), click, image_idx)
+    logging.info(
+        f"Replaying {len(recording.clicks)} clicks of level {recording.level} "
+        f"at {speed}x speed."
+    )
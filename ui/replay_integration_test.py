@@ -0,0 +1,77 @@
+import time
+import tkinter as tk
+from typing import Generator, List
+import pytest
+from game.game_engine import score_for_duration
+from game.session import ReplayReport, SessionRecording
+from ui.playing_level import PlayingLevelUI
+from ui.replay import replay_in_window
+
+
+@pytest.fixture
+def tk_root() -> Generator[tk.Tk, None, None]:
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Tk needs a display")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def replay(root: tk.Tk, recording: SessionRecording) -> ReplayReport:
+    images = [tk.PhotoImage(master=root, width=8, height=8) for _ in range(3)]
+    window = PlayingLevelUI(
+        root,
+        recording.level,
+        images,
+        recording.correct_order,
+        lambda level_completed, duration: None,
+        seed=recording.seed,
+        feedback=False,
+    )
+    reports: List[ReplayReport] = []
+    replay_in_window(window, recording, speed=100.0, on_done=reports.append)
+
+    deadline = time.monotonic() + 5
+    while not reports and time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.001)
+    assert reports, "replay did not finish"
+    return reports[0]
+
+
+def make_recording(clicks: List[List[int]], errors: int) -> SessionRecording:
+    duration_ms = clicks[-1][0]
+    return SessionRecording(
+        level=1,
+        seed=42,
+        correct_order=[0, 1, 2],
+        clicks=clicks,
+        duration_ms=duration_ms,
+        errors=errors,
+        score=score_for_duration(duration_ms / 1000),
+    )
+
+
+def test_replay_in_window_reproduces_recorded_outcome(tk_root: tk.Tk):
+    recording = make_recording(
+        [[1000, 2], [2000, 1], [3000, 0], [5000, 0], [6000, 1], [7000, 2]], errors=1
+    )
+
+    report = replay(tk_root, recording)
+
+    assert report.ok, report.mismatches
+    assert report.completed
+    assert report.errors == 1
+    assert len(report.step_times) == 6
+
+
+def test_replay_in_window_reports_mismatching_outcome(tk_root: tk.Tk):
+    recording = make_recording([[1000, 0], [2000, 2], [3000, 1]], errors=0)
+
+    report = replay(tk_root, recording)
+
+    assert not report.ok
+    assert not report.completed
+    assert "level was not completed" in report.mismatches